@@ -1,30 +1,33 @@
+import io
 import re
+import threading
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from tkinter.scrolledtext import ScrolledText
-import zipfile
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional, Tuple
 from collections import defaultdict
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 # =============================
 # Data structures
 # =============================
 
-@dataclass
+@dataclass(slots=True)
 class EnumDef:
     name: str
     values: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class FieldDef:
     name: str
     type_name: str       # Base type (sin ?, sin [])
     is_optional: bool
     is_list: bool
     raw_line: str
+    ts_type: str = ""       # Tipo TS resuelto (con relaciones)
+    ts_type_flat: str = ""  # Tipo TS resuelto para interfaces *Flat
 
-@dataclass
+@dataclass(slots=True)
 class ModelDef:
     name: str
     fields: List[FieldDef] = field(default_factory=list)
@@ -45,80 +48,66 @@ SCALAR_TS_MAP: Dict[str, str] = {
     "Decimal": "number",
 }
 
-def strip_line_comments(schema: str) -> str:
-    lines = []
-    for line in schema.splitlines():
-        if "//" in line:
-            line = line.split("//", 1)[0]
-        lines.append(line)
-    return "\n".join(lines)
+_SCHEMA_RE = re.compile(r'@@schema\("([^"]+)"\)')
+# Acepta cualquier espacio tras la palabra clave ("model\tA") y corta el nombre
+# en el primer carácter no alfanumérico ("model A{" -> "A")
+_MODEL_ENUM_HEADER_RE = re.compile(r'^\s*(model|enum)\s+(\w+)')
+
+def _consume_block(it: Iterator[str]) -> Iterator[str]:
+    # Avanza el iterador hasta la '}' de cierre, entregando las líneas del cuerpo
+    for line in it:
+        if line == "}":
+            return
+        yield line
 
 def parse_prisma(schema: str):
-    schema_no_comments = strip_line_comments(schema)
-    lines = schema_no_comments.splitlines()
+    # Quitar comentarios '//' y espacios en la misma pasada que el split de líneas
+    lines = [l.partition("//")[0].strip() for l in schema.splitlines()]
 
     enums: Dict[str, EnumDef] = {}
     models: Dict[str, ModelDef] = {}
+    schemas: Dict[str, List[ModelDef]] = defaultdict(list)
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if line.startswith("model ") or line.startswith("enum "):
-            parts = line.split()
-            if len(parts) < 2:
-                i += 1
-                continue
-            kind = parts[0]
-            name = parts[1]
+    it = iter(lines)
+    for line in it:
+        header = _MODEL_ENUM_HEADER_RE.match(line)
+        if header:
+            kind, name = header.groups()
 
             # buscar '{'
             if "{" not in line:
-                i += 1
-                while i < len(lines) and "{" not in lines[i]:
-                    i += 1
-                i += 1
-            else:
-                i += 1
+                for line in it:
+                    if "{" in line:
+                        break
 
-            body_lines = []
-            while i < len(lines):
-                current = lines[i]
-                if current.strip() == "}":
-                    break
-                body_lines.append(current)
-                i += 1
+            body_lines = list(_consume_block(it))
 
             if kind == "enum":
                 enum = EnumDef(name=name)
-                for raw in body_lines:
-                    l = raw.strip()
-                    if not l:
+                add_value = enum.values.append
+                for l in body_lines:
+                    # Líneas vacías y atributos (@@schema, @@map...) se ignoran;
+                    # podrías parsear el schema del enum si lo necesitas
+                    if not l or l[0] == "@":
                         continue
-                    if l.startswith("@@schema"):
-                        # Podrías parsear el schema del enum si lo necesitas
-                        continue
-                    if l.startswith("@") or l.startswith("@@"):
-                        continue
-                    token = l.split()[0]
-                    if token:
-                        enum.values.append(token)
+                    add_value(l.split(None, 1)[0])
                 enums[name] = enum
 
             elif kind == "model":
                 model = ModelDef(name=name)
                 schema_name: Optional[str] = None
-                for raw in body_lines:
-                    l = raw.strip()
+                add_field = model.fields.append
+                for l in body_lines:
                     if not l:
                         continue
-                    if l.startswith("@@schema"):
-                        m = re.search(r'@@schema\("([^"]+)"\)', l)
+                    if l[0] == "@":
+                        # Atributo de bloque: solo interesa @@schema
+                        m = _SCHEMA_RE.match(l)
                         if m:
                             schema_name = m.group(1)
                         continue
-                    if l.startswith("@") or l.startswith("@@"):
-                        continue
-                    parts_f = l.split()
+                    # Solo se necesitan los dos primeros tokens (nombre y tipo)
+                    parts_f = l.split(None, 2)
                     if len(parts_f) < 2:
                         continue
                     field_name = parts_f[0]
@@ -129,42 +118,46 @@ def parse_prisma(schema: str):
                     is_list = raw_type.endswith("[]")
                     base_type = raw_type[:-2] if is_list else raw_type
 
-                    field_def = FieldDef(
+                    add_field(FieldDef(
                         name=field_name,
                         type_name=base_type,
                         is_optional=is_optional,
                         is_list=is_list,
                         raw_line=l,
-                    )
-                    model.fields.append(field_def)
+                    ))
                 model.schema = schema_name
                 models[name] = model
+                schemas[schema_name or "default"].append(model)
 
-        i += 1
-
-    return enums, models
+    return enums, models, schemas
 
 # =============================
 # TS generation helpers
 # =============================
 
+# Clasificación de tipos: nombre Prisma -> (tipo, base TS)
+KIND_SCALAR = 0
+KIND_ENUM = 1
+KIND_MODEL = 2
+KIND_UNKNOWN = 3
+
+def build_kind_map(enums: Dict[str, EnumDef], models: Dict[str, ModelDef]) -> Dict[str, Tuple[int, str]]:
+    kind_map: Dict[str, Tuple[int, str]] = {}
+    for scalar, ts in SCALAR_TS_MAP.items():
+        kind_map[scalar] = (KIND_SCALAR, ts)
+    for enum_name in enums:
+        kind_map[enum_name] = (KIND_ENUM, enum_name)
+    for model_name in models:
+        kind_map[model_name] = (KIND_MODEL, model_name)
+    return kind_map
+
 def prisma_field_to_ts(
     field: FieldDef,
-    model_names: set,
-    enum_names: set,
+    kind_map: Dict[str, Tuple[int, str]],
 ) -> str:
     base = field.type_name
-
-    is_model = base in model_names
-    is_enum = base in enum_names
-    is_scalar = base in SCALAR_TS_MAP
-
-    if is_scalar:
-        ts_base = SCALAR_TS_MAP[base]
-    elif is_enum:
-        ts_base = base
-    else:
-        ts_base = base
+    kind, ts_base = kind_map.get(base, (KIND_UNKNOWN, base))
+    is_model = kind == KIND_MODEL
 
     # Listas
     if field.is_list:
@@ -188,18 +181,13 @@ def prisma_field_to_ts(
 
 def prisma_field_to_ts_flat(
     field: FieldDef,
-    enum_names: set,
+    kind_map: Dict[str, Tuple[int, str]],
 ) -> str:
     base = field.type_name
+    kind, ts_base = kind_map.get(base, (KIND_UNKNOWN, base))
 
-    is_enum = base in enum_names
-    is_scalar = base in SCALAR_TS_MAP
-
-    if is_scalar:
-        ts_base = SCALAR_TS_MAP[base]
-    elif is_enum:
-        ts_base = base
-    else:
+    # Relaciones y tipos desconocidos no tienen forma plana
+    if kind >= KIND_MODEL:
         ts_base = "any"
 
     if field.is_list:
@@ -213,181 +201,205 @@ def prisma_field_to_ts_flat(
 
     return ts_base
 
-def generate_single_file(enums: Dict[str, EnumDef], models: Dict[str, ModelDef], generate_flat: bool) -> str:
-    model_names = set(models.keys())
-    enum_names = set(enums.keys())
+def resolve_ts_types(enums: Dict[str, EnumDef], models: Dict[str, ModelDef]) -> None:
+    # Calcula una sola vez el tipo TS de cada campo; los generadores la llaman al entrar
+    kind_map = build_kind_map(enums, models)
+    to_ts = prisma_field_to_ts
+    to_ts_flat = prisma_field_to_ts_flat
+    for model in models.values():
+        for field in model.fields:
+            field.ts_type = to_ts(field, kind_map)
+            field.ts_type_flat = to_ts_flat(field, kind_map)
 
-    lines = []
+def iter_single_file(enums: Dict[str, EnumDef], models: Dict[str, ModelDef], generate_flat: bool) -> Iterator[str]:
+    # Entrega el archivo por fragmentos (cada uno termina en '\n') sin armarlo completo en memoria
+    resolve_ts_types(enums, models)
+    model_names = frozenset(models)
 
-    lines.append("// Auto-generated from Prisma schema.")
-    lines.append("// Generated by Prisma Types Generator (single file).")
-    lines.append("")
-    lines.append("export type DateTimeString = string;")
-    lines.append("export type JsonValue = any;")
-    lines.append("")
+    yield "// Auto-generated from Prisma schema.\n"
+    yield "// Generated by Prisma Types Generator (single file).\n"
+    yield "\n"
+    yield "export type DateTimeString = string;\n"
+    yield "export type JsonValue = any;\n"
+    yield "\n"
 
     if enums:
-        lines.append("// =========================")
-        lines.append("// ENUM TYPES")
-        lines.append("// =========================")
-        lines.append("")
+        yield "// =========================\n"
+        yield "// ENUM TYPES\n"
+        yield "// =========================\n"
+        yield "\n"
         for enum in enums.values():
             if not enum.values:
                 continue
-            values_union = " | ".join(f'"{v}"' for v in enum.values)
-            lines.append(f"export type {enum.name} = {values_union};")
-            lines.append("")
+            values_union = '"' + '" | "'.join(enum.values) + '"'
+            yield f"export type {enum.name} = {values_union};\n"
+            yield "\n"
 
     # Forward declarations
-    lines.append("// =========================")
-    lines.append("// FORWARD DECLARATIONS")
-    lines.append("// =========================")
-    lines.append("")
+    yield "// =========================\n"
+    yield "// FORWARD DECLARATIONS\n"
+    yield "// =========================\n"
+    yield "\n"
     for model_name in models.keys():
-        lines.append(f"export interface {model_name} {{}}")
-    lines.append("")
+        yield f"export interface {model_name} {{}}\n"
+    yield "\n"
 
     # Models
-    lines.append("// =========================")
-    lines.append("// MODELS")
-    lines.append("// =========================")
-    lines.append("")
+    yield "// =========================\n"
+    yield "// MODELS\n"
+    yield "// =========================\n"
 
+    # Cada interfaz va precedida de una línea en blanco, así el archivo termina en '}\n'
     for model in models.values():
-        lines.append(f"export interface {model.name} " + "{")
+        yield "\n"
+        yield f"export interface {model.name} {{\n"
         for field in model.fields:
-            ts_type = prisma_field_to_ts(field, model_names, enum_names)
-            lines.append(f"  {field.name}: {ts_type};")
-        lines.append("}")
-        lines.append("")
+            yield f"  {field.name}: {field.ts_type};\n"
+        yield "}\n"
         if generate_flat:
-            lines.append(f"export interface {model.name}Flat " + "{")
+            yield "\n"
+            yield f"export interface {model.name}Flat {{\n"
             for field in model.fields:
                 # solo campos no-relacionales
                 if field.type_name in model_names:
                     continue
-                ts_type_flat = prisma_field_to_ts_flat(field, enum_names)
-                lines.append(f"  {field.name}: {ts_type_flat};")
-            lines.append("}")
-            lines.append("")
-    return "\n".join(lines)
+                yield f"  {field.name}: {field.ts_type_flat};\n"
+            yield "}\n"
 
-def generate_split_files(enums: Dict[str, EnumDef], models: Dict[str, ModelDef], generate_flat: bool, generate_index: bool) -> Dict[str, str]:
+def generate_single_file(enums: Dict[str, EnumDef], models: Dict[str, ModelDef], generate_flat: bool) -> str:
+    return "".join(iter_single_file(enums, models, generate_flat))
+
+def generate_split_files(
+    enums: Dict[str, EnumDef],
+    models: Dict[str, ModelDef],
+    models_by_schema: Dict[str, List[ModelDef]],
+    generate_flat: bool,
+    generate_index: bool,
+) -> Dict[str, str]:
+    resolve_ts_types(enums, models)
     files: Dict[str, str] = {}
-    model_names = set(models.keys())
-    enum_names = set(enums.keys())
+    model_names = frozenset(models)
+    enum_names = frozenset(enums)
 
     # common/base.ts
-    base_lines = []
-    base_lines.append("// Auto-generated by Prisma Types Generator")
-    base_lines.append("// Common base types")
-    base_lines.append("export type DateTimeString = string;")
-    base_lines.append("export type JsonValue = any;")
-    base_lines.append("")
-    files["common/base.ts"] = "\n".join(base_lines)
+    buf = io.StringIO()
+    w = buf.write
+    w("// Auto-generated by Prisma Types Generator\n")
+    w("// Common base types\n")
+    w("export type DateTimeString = string;\n")
+    w("export type JsonValue = any;\n")
+    files["common/base.ts"] = buf.getvalue()
 
     # common/enums.ts
-    enums_lines = []
-    enums_lines.append("// Auto-generated by Prisma Types Generator")
-    enums_lines.append("// Enums for the whole schema")
-    if enums:
-        enums_lines.append("")
-        for enum in enums.values():
-            if not enum.values:
-                continue
-            values_union = " | ".join(f'"{v}"' for v in enum.values)
-            enums_lines.append(f"export type {enum.name} = {values_union};")
-            enums_lines.append("")
-    files["common/enums.ts"] = "\n".join(enums_lines)
-
-    # Partition models by schema
-    models_by_schema: Dict[str, List[ModelDef]] = defaultdict(list)
-    for m in models.values():
-        key = m.schema or "default"
-        models_by_schema[key].append(m)
-
-    # Map model -> schema
-    model_to_schema: Dict[str, str] = {}
-    for schema_name, lst in models_by_schema.items():
-        for m in lst:
-            model_to_schema[m.name] = schema_name
+    buf = io.StringIO()
+    w = buf.write
+    w("// Auto-generated by Prisma Types Generator\n")
+    w("// Enums for the whole schema\n")
+    for enum in enums.values():
+        if not enum.values:
+            continue
+        values_union = '"' + '" | "'.join(enum.values) + '"'
+        w("\n")
+        w(f"export type {enum.name} = {values_union};\n")
+    files["common/enums.ts"] = buf.getvalue()
 
     # Generate per-schema files
     for schema_name, schema_models in models_by_schema.items():
-        lines: List[str] = []
-        lines.append("// Auto-generated by Prisma Types Generator")
-        lines.append("// Types for schema: " + schema_name)
-        lines.append('import type { DateTimeString, JsonValue } from "../common/base";')
-        if enums:
-            # import all enums (más simple)
-            enum_imports = ", ".join(sorted(enum_names))
-            lines.append(f'import type {{ {enum_imports} }} from "../common/enums";')
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("// Auto-generated by Prisma Types Generator\n")
+        w("// Types for schema: " + schema_name + "\n")
+        w('import type { DateTimeString, JsonValue } from "../common/base";\n')
+        # importar solo los enums usados por los modelos de este schema
+        used_enums = {
+            field.type_name
+            for m in schema_models
+            for field in m.fields
+            if field.type_name in enum_names
+        }
+        if used_enums:
+            enum_imports = ", ".join(sorted(used_enums))
+            w(f'import type {{ {enum_imports} }} from "../common/enums";\n')
 
         # Cross-schema model imports
+        # (con un solo schema no puede haber referencias a otros)
         cross_imports: Dict[str, set] = defaultdict(set)
-        for m in schema_models:
-            for field in m.fields:
-                if field.type_name in model_names:
-                    other_schema = model_to_schema.get(field.type_name, schema_name)
-                    if other_schema != schema_name:
-                        cross_imports[other_schema].add(field.type_name)
+        if len(models_by_schema) > 1:
+            for m in schema_models:
+                for field in m.fields:
+                    target = models.get(field.type_name)
+                    if target is not None:
+                        other_schema = target.schema or "default"
+                        if other_schema != schema_name:
+                            cross_imports[other_schema].add(field.type_name)
+        if cross_imports:
+            w("\n")
         for other_schema, names in cross_imports.items():
             if not names:
                 continue
             imported_names = ", ".join(sorted(names))
-            lines.append(f'import type {{ {imported_names} }} from "../{other_schema}/models";')
-        if cross_imports:
-            lines.append("")
+            w(f'import type {{ {imported_names} }} from "../{other_schema}/models";\n')
 
-        # Models
+        # Models (cada interfaz precedida de una línea en blanco)
         for m in schema_models:
-            lines.append(f"export interface {m.name} " + "{")
+            w("\n")
+            w(f"export interface {m.name} {{\n")
             for field in m.fields:
-                ts_type = prisma_field_to_ts(field, model_names, enum_names)
-                lines.append(f"  {field.name}: {ts_type};")
-            lines.append("}")
-            lines.append("")
+                w(f"  {field.name}: {field.ts_type};\n")
+            w("}\n")
             if generate_flat:
-                lines.append(f"export interface {m.name}Flat " + "{")
+                w("\n")
+                w(f"export interface {m.name}Flat {{\n")
                 for field in m.fields:
                     if field.type_name in model_names:
                         continue
-                    ts_type_flat = prisma_field_to_ts_flat(field, enum_names)
-                    lines.append(f"  {field.name}: {ts_type_flat};")
-                lines.append("}")
-                lines.append("")
+                    w(f"  {field.name}: {field.ts_type_flat};\n")
+                w("}\n")
 
-        files[f"{schema_name}/models.ts"] = "\n".join(lines)
+        files[f"{schema_name}/models.ts"] = buf.getvalue()
 
     # index.ts
     if generate_index:
-        idx_lines: List[str] = []
-        idx_lines.append('export * from "./common/base";')
-        idx_lines.append('export * from "./common/enums";')
+        buf = io.StringIO()
+        w = buf.write
+        w('export * from "./common/base";\n')
+        w('export * from "./common/enums";\n')
         for schema_name in sorted(models_by_schema.keys()):
-            idx_lines.append(f'export * from "./{schema_name}/models";')
-        idx_lines.append("")
-        files["index.ts"] = "\n".join(idx_lines)
+            w(f'export * from "./{schema_name}/models";\n')
+        files["index.ts"] = buf.getvalue()
 
     return files
 
 def prisma_to_ts(schema: str) -> str:
-    enums, models = parse_prisma(schema)
+    enums, models, _ = parse_prisma(schema)
     return generate_single_file(enums, models, generate_flat=False)
 
+def prisma_to_ts_iter(schema: str) -> Iterator[str]:
+    enums, models, _ = parse_prisma(schema)
+    return iter_single_file(enums, models, generate_flat=False)
+
 # =============================
 # GUI
 # =============================
 
+# tkinter y zipfile se importan dentro de los métodos: el uso como librería
+# (parse_prisma / generate_* / prisma_to_ts) no paga el costo de cargar Tcl/Tk.
+
 class PrismaToTSApp:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: "tk.Tk"):
+        import tkinter as tk
+        from tkinter.scrolledtext import ScrolledText
+
         self.root = root
         self.root.title("Prisma → TypeScript (Tkinter GUI)")
         self.root.geometry("1200x750")
 
-        self.generated_files: Dict[str, str] = {}
+        # Contenido ya codificado en UTF-8, listo para guardar o comprimir
+        self.generated_files: List[Tuple[str, bytes]] = []
+        self._file_index: Dict[str, int] = {}
         self.preview_file: Optional[str] = None
+        self._zip_thread: Optional[threading.Thread] = None
+        self._zip_error: Optional[Exception] = None
 
         top_frame = tk.Frame(root)
         top_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
@@ -408,6 +420,7 @@ class PrismaToTSApp:
         self.split_var = tk.StringVar(value="No")
         self.flat_var = tk.StringVar(value="No")
         self.index_var = tk.StringVar(value="No")
+        self.compress_var = tk.StringVar(value="Sí")
 
         tk.Label(top_frame, text="Dividir por schema:").pack(side=tk.LEFT, padx=(20, 2))
         tk.OptionMenu(top_frame, self.split_var, "No", "Sí").pack(side=tk.LEFT)
@@ -418,6 +431,9 @@ class PrismaToTSApp:
         tk.Label(top_frame, text="Generar index.ts:").pack(side=tk.LEFT, padx=(10, 2))
         tk.OptionMenu(top_frame, self.index_var, "No", "Sí").pack(side=tk.LEFT)
 
+        tk.Label(top_frame, text="Comprimir ZIP:").pack(side=tk.LEFT, padx=(10, 2))
+        tk.OptionMenu(top_frame, self.compress_var, "Sí", "No").pack(side=tk.LEFT)
+
         self.status_label = tk.Label(top_frame, text="Listo.", anchor="w")
         self.status_label.pack(side=tk.LEFT, padx=20)
 
@@ -439,6 +455,9 @@ class PrismaToTSApp:
         self.ts_text.pack(fill=tk.BOTH, expand=True)
 
     def load_schema(self):
+        import tkinter as tk
+        from tkinter import filedialog, messagebox
+
         path = filedialog.askopenfilename(
             title="Selecciona el archivo schema.prisma",
             filetypes=[("Prisma schema", "*.prisma"), ("Todos los archivos", "*.*")]
@@ -455,6 +474,9 @@ class PrismaToTSApp:
             messagebox.showerror("Error", f"No se pudo leer el archivo:\n{e}")
 
     def generate_ts(self):
+        import tkinter as tk
+        from tkinter import messagebox
+
         schema = self.schema_text.get("1.0", tk.END)
         if not schema.strip():
             messagebox.showwarning("Atención", "El área de schema Prisma está vacía.")
@@ -465,29 +487,31 @@ class PrismaToTSApp:
         generate_index = self.index_var.get() == "Sí"
 
         try:
-            enums, models = parse_prisma(schema)
+            enums, models, schemas = parse_prisma(schema)
             if split_by_schema:
-                files = generate_split_files(enums, models, generate_flat, generate_index)
+                files = generate_split_files(enums, models, schemas, generate_flat, generate_index)
             else:
                 main_ts = generate_single_file(enums, models, generate_flat)
                 files = {"models.ts": main_ts}
                 if generate_index:
                     files["index.ts"] = 'export * from "./models";\n'
 
-            self.generated_files = files
+            self.generated_files = [(name, content.encode("utf-8")) for name, content in files.items()]
+            self._file_index = {name: i for i, (name, _) in enumerate(self.generated_files)}
 
             # elegir archivo de preview
-            if "models.ts" in files:
+            if "models.ts" in self._file_index:
                 preview_name = "models.ts"
-            elif "index.ts" in files:
+            elif "index.ts" in self._file_index:
                 preview_name = "index.ts"
             else:
-                preview_name = sorted(files.keys())[0]
+                preview_name = min(self._file_index)
 
             self.preview_file = preview_name
 
+            # archivos listados en el orden en que se generaron
             header = "// Archivos generados:\n"
-            for name in sorted(files.keys()):
+            for name, _ in self.generated_files:
                 header += f"// - {name}\n"
             header += "\n"
 
@@ -498,10 +522,13 @@ class PrismaToTSApp:
             messagebox.showerror("Error", f"Ocurrió un problema al generar TS:\n{e}")
 
     def save_ts(self):
+        from tkinter import filedialog, messagebox
+
         if not self.generated_files or not self.preview_file:
             messagebox.showwarning("Atención", "No hay código TypeScript generado aún.")
             return
-        ts_code = self.generated_files.get(self.preview_file, "")
+        idx = self._file_index.get(self.preview_file)
+        ts_code = self.generated_files[idx][1] if idx is not None else b""
         if not ts_code.strip():
             messagebox.showwarning("Atención", "El archivo de preview está vacío.")
             return
@@ -514,16 +541,23 @@ class PrismaToTSApp:
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as f:
+            with open(path, "wb") as f:
                 f.write(ts_code)
             self.status_label.config(text=f"{self.preview_file} guardado en: {path}")
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo guardar el archivo:\n{e}")
 
     def save_zip(self):
+        import tkinter as tk
+        import zipfile
+        from tkinter import filedialog, messagebox
+
         if not self.generated_files:
             messagebox.showwarning("Atención", "No hay archivos generados para guardar en ZIP.")
             return
+        if self._zip_thread is not None and self._zip_thread.is_alive():
+            messagebox.showwarning("Atención", "Ya se está guardando un ZIP, espera a que termine.")
+            return
 
         path = filedialog.asksaveasfilename(
             title="Guardar ZIP con archivos TS",
@@ -532,15 +566,48 @@ class PrismaToTSApp:
         )
         if not path:
             return
+
+        # Sin compresión (ZIP_STORED) se evita zlib por completo
+        compression = zipfile.ZIP_DEFLATED if self.compress_var.get() == "Sí" else zipfile.ZIP_STORED
+        # generate_ts reemplaza la lista en vez de mutarla, así que el hilo puede usarla tal cual
+        entries = self.generated_files
+        self._zip_error = None
+        self._zip_thread = threading.Thread(
+            target=self._do_zip, args=(path, entries, compression), daemon=True
+        )
+        self._zip_thread.start()
+        self.save_zip_button.config(state=tk.DISABLED)
+        self.status_label.config(text=f"Guardando ZIP en: {path}...")
+        self.root.after(100, self._poll_zip, path)
+
+    def _do_zip(self, path: str, entries: List[Tuple[str, bytes]], compression: int):
+        # Corre en un hilo aparte: no debe tocar widgets de Tk
+        import zipfile
+
         try:
-            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for name, content in self.generated_files.items():
+            with zipfile.ZipFile(path, "w", compression) as zf:
+                for name, content in entries:
                     zf.writestr(name, content)
-            self.status_label.config(text=f"ZIP guardado en: {path}")
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo guardar el ZIP:\n{e}")
+            self._zip_error = e
+
+    def _poll_zip(self, path: str):
+        import tkinter as tk
+        from tkinter import messagebox
+
+        if self._zip_thread is not None and self._zip_thread.is_alive():
+            self.root.after(100, self._poll_zip, path)
+            return
+        self.save_zip_button.config(state=tk.NORMAL)
+        if self._zip_error is not None:
+            messagebox.showerror("Error", f"No se pudo guardar el ZIP:\n{self._zip_error}")
+            self.status_label.config(text="Error al guardar el ZIP.")
+        else:
+            self.status_label.config(text=f"ZIP guardado en: {path}")
 
 def run_app():
+    import tkinter as tk
+
     root = tk.Tk()
     app = PrismaToTSApp(root)
     root.mainloop()